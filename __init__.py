@@ -1,3 +1,4 @@
+import os
 from flask import Flask
 from flask_login import LoginManager
 from flask_mail import Mail
@@ -18,6 +19,36 @@ def create_app():
         'pool_pre_ping': True  # check if connection is alive before query
     }
 
+    # --- Order status updates on /order ---
+    # 'poll': /order/status/poll answers at once from the shared status log, so it
+    #   works on a few sync uWSGI workers and across worker processes.
+    # 'sse': /order/status/stream holds a worker thread per open /order tab for up
+    #   to STATUS_STREAM_MAX_AGE. Only use it with gevent/async workers. The
+    #   in-process broker only reaches streams in the worker that made the change;
+    #   streams in other workers get it from the log when they reconnect.
+    app.config['STATUS_TRANSPORT'] = 'poll'
+    app.config['STATUS_POLL_INTERVAL_MS'] = 15000  # browser poll period
+    app.config['STATUS_POLL_LIMIT'] = 50           # max deltas per poll / replay
+    app.config['STATUS_STREAM_KEEPALIVE'] = 15     # seconds between keep-alive comments
+    app.config['STATUS_STREAM_MAX_AGE'] = 120      # seconds before the server closes a stream
+    app.config['STATUS_STREAM_RETRY_MS'] = 3000    # browser reconnect delay
+    # Shared secret for POST /order/<id>/status (X-Status-Token); None disables it
+    app.config['STATUS_UPDATE_TOKEN'] = os.environ.get('STATUS_UPDATE_TOKEN')
+
+    # --- Response compression (HTML / JSON) ---
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json']
+    app.config['COMPRESS_MIN_SIZE'] = 500        # bytes; smaller bodies go out as-is
+    app.config['COMPRESS_LEVEL'] = 6             # gzip, 1-9
+    app.config['COMPRESS_BROTLI_QUALITY'] = 5    # brotli, 0-11 (only if installed)
+    app.config['COMPRESS_STREAM_BUFFER'] = 8192  # bytes buffered per streamed write
+    app.config['COMPRESS_STREAM_FLUSH_AFTER'] = '<main>'  # send header/nav as soon as this passes
+
+    # --- Maintenance (flask cleanup) ---
+    app.config['CART_TTL_DAYS'] = 30
+    app.config['ORDER_ARCHIVE_DAYS'] = 365
+    app.config['MAINTENANCE_BATCH_SIZE'] = 500
+    app.config['ARCHIVE_DIR'] = os.path.join(app.instance_path, 'archive')
+
     db.init_app(app)
 
     # --- Mail configuration ---
@@ -40,4 +71,13 @@ def create_app():
     from routes import register_routes
     register_routes(app)
 
+    from events import register_status_commands
+    register_status_commands(app)
+
+    from maintenance import register_commands
+    register_commands(app)
+
+    from compression import register_compression
+    register_compression(app)
+
     return app
@@ -0,0 +1,67 @@
+"""Time-to-first-byte and bytes-on-wire for the main pages.
+
+Run against a live server, e.g.:
+
+    python bench.py http://127.0.0.1:5000 --cookie "session=..."
+
+The session cookie (copied from a logged-in browser) is needed for /cart
+and /order. Each page is fetched once per Accept-Encoding.
+"""
+import argparse
+import http.client
+import time
+from urllib.parse import urlsplit
+
+PAGES = ['/', '/menu', '/cart', '/order']
+ENCODINGS = ['identity', 'gzip', 'br']
+
+def fetch(base, path, encoding, cookie, runs):
+    url = urlsplit(base)
+    conn_cls = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+    headers = {'Accept-Encoding': encoding}
+    if cookie:
+        headers['Cookie'] = cookie
+
+    ttfb, first_chunk, total, size, served = [], [], [], 0, ''
+    for _ in range(runs):
+        conn = conn_cls(url.netloc)
+        start = time.perf_counter()
+        conn.request('GET', path, headers=headers)
+        resp = conn.getresponse()
+        ttfb.append(time.perf_counter() - start)
+        # read1 returns as soon as the first body bytes arrive (streamed pages)
+        body = resp.read1()
+        first_chunk.append(time.perf_counter() - start)
+        body += resp.read()
+        total.append(time.perf_counter() - start)
+        # http.client does not decode Content-Encoding, so this is bytes on wire
+        size = len(body)
+        served = resp.getheader('Content-Encoding', 'identity')
+        conn.close()
+
+    return {
+        'ttfb': min(ttfb) * 1000,
+        'first_chunk': min(first_chunk) * 1000,
+        'total': min(total) * 1000,
+        'bytes': size,
+        'served': served,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('base_url', nargs='?', default='http://127.0.0.1:5000')
+    parser.add_argument('--cookie', default=None, help='Cookie header for login-only pages.')
+    parser.add_argument('--runs', type=int, default=5, help='Best of N per page/encoding.')
+    args = parser.parse_args()
+
+    print(f"{'page':<10}{'asked':<10}{'served':<10}{'ttfb ms':>10}{'1st chunk':>11}{'total ms':>10}{'bytes':>10}")
+    for path in PAGES:
+        for encoding in ENCODINGS:
+            r = fetch(args.base_url, path, encoding, args.cookie, args.runs)
+            print(
+                f"{path:<10}{encoding:<10}{r['served']:<10}"
+                f"{r['ttfb']:>10.1f}{r['first_chunk']:>11.1f}{r['total']:>10.1f}{r['bytes']:>10}"
+            )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+import gzip
+import zlib
+from flask import request
+
+try:
+    import brotli  # optional — pip install brotli to enable 'br'
+except ImportError:
+    brotli = None
+
+# ============================================================
+# STREAM BUFFERING
+# ============================================================
+def _coalesce(chunks, size, flush_after):
+    """Group Jinja's per-literal / per-expression fragments into ~``size`` byte
+    pieces, so each socket write (and compressor flush) carries real content.
+
+    The piece containing ``flush_after`` (base.html's ``<main>``) is released
+    straight away, so the header and nav go out before the page body starts
+    its DB work.
+    """
+    marker = flush_after.encode('utf-8') if flush_after else None
+    buffer, buffered = [], 0
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if not chunk:
+                continue
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= size or (marker and marker in chunk):
+                yield b''.join(buffer)
+                buffer, buffered = [], 0
+                if marker and marker in chunk:
+                    marker = None  # only the first occurrence matters
+        if buffer:
+            yield b''.join(buffer)
+    finally:
+        # Let stream_with_context tear down the request context on disconnect
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+# ============================================================
+# ENCODERS
+# ============================================================
+def _gzip_stream(pieces, level):
+    # wbits=31 → gzip container; one sync flush per coalesced piece
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    try:
+        for piece in pieces:
+            yield compressor.compress(piece) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        pieces.close()
+
+def _brotli_stream(pieces, quality):
+    compressor = brotli.Compressor(quality=quality)
+    try:
+        for piece in pieces:
+            yield compressor.process(piece) + compressor.flush()
+        yield compressor.finish()
+    finally:
+        pieces.close()
+
+# ============================================================
+# RESPONSE PIPELINE
+# ============================================================
+def register_compression(app):
+    @app.after_request
+    def compress_response(response):
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in app.config['COMPRESS_MIMETYPES']
+        ):
+            return response
+
+        offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+        encoding = request.accept_encodings.best_match(offered)
+
+        response.vary.add('Accept-Encoding')
+
+        if response.is_streamed:
+            # stream_template pages: buffer fragments, then compress piece by piece
+            pieces = _coalesce(
+                response.response,
+                app.config['COMPRESS_STREAM_BUFFER'],
+                app.config['COMPRESS_STREAM_FLUSH_AFTER']
+            )
+            if encoding == 'br':
+                pieces = _brotli_stream(pieces, app.config['COMPRESS_BROTLI_QUALITY'])
+            elif encoding == 'gzip':
+                pieces = _gzip_stream(pieces, app.config['COMPRESS_LEVEL'])
+            response.response = pieces
+            response.headers.pop('Content-Length', None)
+            if encoding is None:
+                return response
+        else:
+            if encoding is None:
+                return response
+            data = response.get_data()
+            if len(data) < app.config['COMPRESS_MIN_SIZE']:
+                return response
+            if encoding == 'br':
+                data = brotli.compress(data, quality=app.config['COMPRESS_BROTLI_QUALITY'])
+            else:
+                data = gzip.compress(data, compresslevel=app.config['COMPRESS_LEVEL'])
+            response.set_data(data)
+
+        response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,94 @@
+import json
+import queue
+import threading
+import click
+from models import db, Order, OrderStatusEvent
+
+# ============================================================
+# ORDER STATUS PUB/SUB
+# ============================================================
+class StatusBroker:
+    """In-process fan-out of order status changes, keyed by user id.
+
+    Each open /order/status/stream connection subscribes with its own queue.
+    Only streams in the publishing process are reached; the status log is
+    the cross-process source of truth.
+    """
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        q = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(q)
+        return q
+
+    def unsubscribe(self, user_id, q):
+        with self._lock:
+            listeners = self._subscribers.get(user_id)
+            if not listeners:
+                return
+            listeners.discard(q)
+            if not listeners:
+                del self._subscribers[user_id]
+
+    def publish(self, user_id, event):
+        with self._lock:
+            listeners = list(self._subscribers.get(user_id, ()))
+        for q in listeners:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                # Slow client — drop the delta, it can catch up via Last-Event-ID
+                pass
+
+
+status_broker = StatusBroker()
+
+
+def status_event_payload(event):
+    """Delta sent to the browser: only the order id and its new status."""
+    return {'id': event.id, 'order_id': event.order_id, 'status': event.status}
+
+
+def format_sse(payload):
+    return (
+        f"id: {payload['id']}\n"
+        f"event: status\n"
+        f"data: {json.dumps({'order_id': payload['order_id'], 'status': payload['status']})}\n\n"
+    )
+
+
+def update_order_status(order, status):
+    """Change an order's status, log it and notify the owner's open streams."""
+    order.status = status
+    event = OrderStatusEvent(order_id=order.id, user_id=order.user_id, status=status)
+    db.session.add(event)
+    db.session.commit()
+
+    status_broker.publish(order.user_id, status_event_payload(event))
+    return event
+
+# ============================================================
+# CLI COMMANDS
+# ============================================================
+def register_status_commands(app):
+    @app.cli.command('set-order-status')
+    @click.argument('order_id', type=int)
+    @click.argument('status')
+    def set_order_status(order_id, status):
+        """Change an order's status and log it for the customer's /order pages.
+
+        This runs outside the web workers, so nothing is pushed from here:
+        pages see the change on their next poll (or SSE reconnect). Use
+        POST /order/<id>/status for an in-worker change.
+        """
+        order = Order.query.get(order_id)
+        if not order:
+            raise click.ClickException(f"Order #{order_id} not found.")
+
+        event = update_order_status(order, status)
+        click.echo(f"Order #{order_id} is now '{status}' (event {event.id}).")
@@ -0,0 +1,140 @@
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+import click
+from models import db, Cart, Feedback, Order, OrderAddon, OrderItem, OrderStatusEvent
+from sqlalchemy import func, select
+
+EPOCH = datetime(1970, 1, 1)
+
+# ============================================================
+# ABANDONED CART CLEANUP
+# ============================================================
+def purge_abandoned_carts(ttl_days, batch_size):
+    """Delete carts whose owner has not touched them for ``ttl_days``.
+
+    Deletes at most ``batch_size`` rows per transaction, so the live cart
+    table is never locked for long. Rows without an ``updated_at`` count as
+    stale.
+    """
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=ttl_days)
+    row_is_stale = func.coalesce(Cart.updated_at, EPOCH) < cutoff
+    stale_users = (
+        db.session.query(Cart.user_id)
+        .group_by(Cart.user_id)
+        .having(func.coalesce(func.max(Cart.updated_at), EPOCH) < cutoff)
+    )
+    deleted = 0
+
+    while True:
+        cart_ids = [
+            row.id for row in (
+                db.session.query(Cart.id)
+                .filter(Cart.user_id.in_(stale_users), row_is_stale)
+                .limit(batch_size)
+                .all()
+            )
+        ]
+        if not cart_ids:
+            break
+
+        # Re-check staleness per row and per user: if the customer touched
+        # their cart since the SELECT, the whole cart is kept. The user check
+        # goes through a derived table, as MySQL won't let a DELETE read its
+        # own table in a plain subquery.
+        stale_users_now = stale_users.subquery()
+        deleted += (
+            Cart.query
+            .filter(
+                Cart.id.in_(cart_ids),
+                Cart.user_id.in_(select(stale_users_now.c.user_id)),
+                row_is_stale
+            )
+            .delete(synchronize_session=False)
+        )
+        db.session.commit()
+
+    return deleted
+
+# ============================================================
+# OLD ORDER ARCHIVAL
+# ============================================================
+def _serialize(row):
+    data = {}
+    for column in row.__table__.columns:
+        value = getattr(row, column.name)
+        data[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
+def archive_old_orders(cutoff_days, batch_size, archive_dir):
+    """Move orders older than ``cutoff_days`` into a gzipped JSONL export.
+
+    Each order is written as one line holding its items, addons, feedback and
+    status history. A batch is flushed to disk before the matching rows are
+    deleted, and every batch is its own transaction.
+    """
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=cutoff_days)
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"orders-{datetime.now(timezone.utc):%Y%m%d}.jsonl.gz")
+    archived = 0
+
+    while True:
+        orders = (
+            Order.query
+            .filter(Order.order_date < cutoff)
+            .order_by(Order.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not orders:
+            break
+
+        order_ids = [order.id for order in orders]
+        feedbacks = Feedback.query.filter(Feedback.order_id.in_(order_ids)).all()
+        status_events = OrderStatusEvent.query.filter(OrderStatusEvent.order_id.in_(order_ids)).all()
+
+        # Appending adds a new gzip member per batch; readers see one stream
+        with gzip.open(path, 'at', encoding='utf-8') as archive:
+            for order in orders:
+                record = _serialize(order)
+                record['items'] = [_serialize(item) for item in order.items]
+                record['addons'] = [_serialize(addon) for addon in order.addons]
+                record['feedbacks'] = [_serialize(fb) for fb in feedbacks if fb.order_id == order.id]
+                record['status_events'] = [_serialize(ev) for ev in status_events if ev.order_id == order.id]
+                archive.write(json.dumps(record) + '\n')
+            archive.flush()
+            os.fsync(archive.fileno())
+
+        for model in (Feedback, OrderStatusEvent, OrderAddon, OrderItem):
+            model.query.filter(model.order_id.in_(order_ids)).delete(synchronize_session=False)
+        Order.query.filter(Order.id.in_(order_ids)).delete(synchronize_session=False)
+        db.session.commit()
+        db.session.expunge_all()
+
+        archived += len(order_ids)
+
+    return archived, path
+
+# ============================================================
+# CLI COMMANDS
+# ============================================================
+def register_commands(app):
+    @app.cli.command('cleanup')
+    @click.option('--cart-ttl-days', type=int, default=None, help='Delete carts idle for longer than this.')
+    @click.option('--order-cutoff-days', type=int, default=None, help='Archive orders older than this.')
+    @click.option('--batch-size', type=click.IntRange(min=1), default=None, help='Rows per transaction.')
+    def cleanup(cart_ttl_days, order_cutoff_days, batch_size):
+        """Purge abandoned carts and archive old orders (run from a scheduled task)."""
+        if cart_ttl_days is None:
+            cart_ttl_days = app.config['CART_TTL_DAYS']
+        if order_cutoff_days is None:
+            order_cutoff_days = app.config['ORDER_ARCHIVE_DAYS']
+        if batch_size is None:
+            batch_size = app.config['MAINTENANCE_BATCH_SIZE']
+
+        carts = purge_abandoned_carts(cart_ttl_days, batch_size)
+        click.echo(f"Deleted {carts} abandoned cart rows (idle > {cart_ttl_days} days).")
+
+        orders, path = archive_old_orders(order_cutoff_days, batch_size, app.config['ARCHIVE_DIR'])
+        click.echo(f"Archived {orders} orders older than {order_cutoff_days} days to {path}.")
@@ -0,0 +1,15 @@
+-- Order status change log used by /order/status/stream.
+-- Apply before deploying: place_order() inserts into this table.
+CREATE TABLE order_status_events (
+    id INT NOT NULL AUTO_INCREMENT,
+    order_id INT NOT NULL,
+    user_id INT NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    created_at DATETIME NULL,
+    PRIMARY KEY (id),
+    KEY ix_order_status_events_user_id (user_id),
+    CONSTRAINT fk_order_status_events_order
+        FOREIGN KEY (order_id) REFERENCES orders (id) ON DELETE CASCADE,
+    CONSTRAINT fk_order_status_events_user
+        FOREIGN KEY (user_id) REFERENCES users (id)
+);
@@ -0,0 +1,8 @@
+-- Cart activity timestamp used by `flask cleanup` to purge abandoned carts.
+-- Apply before deploying: every Cart query selects this column.
+ALTER TABLE cart ADD COLUMN updated_at DATETIME NULL;
+CREATE INDEX ix_cart_updated_at ON cart (updated_at);
+
+-- Existing rows have no activity history; start their TTL from today
+-- rather than purging carts of customers who are still shopping.
+UPDATE cart SET updated_at = UTC_TIMESTAMP() WHERE updated_at IS NULL;
@@ -0,0 +1,3 @@
+-- Lets `flask cleanup` find orders past the archive cutoff without
+-- scanning the whole orders table on every batch.
+CREATE INDEX ix_orders_order_date ON orders (order_date);
@@ -91,6 +91,12 @@ class Cart(db.Model):
     option_selected = db.Column(db.String(50))
     special_request = db.Column(db.String(200))
     price = db.Column(db.Float, nullable=False)
+    updated_at = db.Column(
+        db.DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        index=True
+    )  # last activity, used to purge abandoned carts
 
 # ============================================================
 # ORDER MODEL
@@ -102,7 +108,7 @@ class Order(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     payment_method_id = db.Column(db.Integer, db.ForeignKey('payment_methods.id'))
     total_amount = db.Column(db.Float, nullable=False)
-    order_date = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    order_date = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), index=True)
     status = db.Column(db.String(50), default='Pending')
     delivery_method = db.Column(db.String(20))  # 'pickup' or 'delivery'
     delivery_address = db.Column(db.String(255), nullable=True)
@@ -114,10 +120,26 @@ class Order(db.Model):
     payment_method = db.relationship('PaymentMethod', lazy='joined')
 
     feedbacks = db.relationship('Feedback', backref='order', lazy=True)
+    status_events = db.relationship('OrderStatusEvent', backref='order', lazy=True, cascade='all, delete-orphan')
 
     def __repr__(self):
         return f"<Order #{self.id} - User {self.user_id}>"
 
+# ============================================================
+# ORDER STATUS EVENT MODEL
+# ============================================================
+class OrderStatusEvent(db.Model):
+    __tablename__ = 'order_status_events'
+
+    id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('orders.id', ondelete='CASCADE'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    status = db.Column(db.String(50), nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<OrderStatusEvent Order={self.order_id} Status={self.status}>"
+
 # ============================================================
 # ORDER ITEM MODEL
 # ============================================================
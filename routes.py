@@ -1,9 +1,14 @@
+import hmac
+import queue
+import time
 from datetime import datetime, timezone
-from flask import flash, jsonify, redirect, render_template, request, session, url_for
+from flask import Response, flash, jsonify, redirect, render_template, request, session, stream_template, url_for
 from flask_login import login_user, login_required, logout_user, current_user
 from flask_mail import Message
 from __init__ import mail
-from models import db, Box, Cake, Candle, Card, Cart, Feedback, Order, OrderAddon, OrderItem, PaymentMethod, User
+from events import format_sse, status_broker, status_event_payload, update_order_status
+from models import db, Box, Cake, Candle, Card, Cart, Feedback, Order, OrderAddon, OrderItem, OrderStatusEvent, PaymentMethod, User
+from sqlalchemy import func
 from sqlalchemy.orm import joinedload
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -277,7 +282,7 @@ def register_routes(app):
             scheduled_datetime=selected_dt
         )
         db.session.add(order)
-        db.session.commit()
+        db.session.flush()  # assigns order.id; order, items and status event commit together
 
         # Transfer cart items
         for item in cart_items:
@@ -319,19 +324,147 @@ def register_routes(app):
             # remove from cart
             db.session.delete(item)
 
+        # Log the initial status so open status streams pick up the new order
+        status_event = OrderStatusEvent(order_id=order.id, user_id=current_user.id, status=order.status)
+        db.session.add(status_event)
+
         db.session.commit()
+        status_broker.publish(current_user.id, status_event_payload(status_event))
         return jsonify({'success': True, 'message': 'Order placed successfully!'})
 
+    def guard_stream(chunks, path):
+        # Errors in a streamed body arrive after the headers; close the page
+        # with a notice the customer can see rather than a cut-off 200
+        try:
+            yield from chunks
+        except Exception:
+            # The request context is gone by now, hence the path argument
+            app.logger.exception("Error while streaming %s", path)
+            yield (
+                '<div class="empty-order">'
+                '<h3>Sorry, we couldn’t load all of your orders.</h3>'
+                '<p>Please refresh the page in a moment.</p>'
+                '</div></main></body></html>'
+            )
+        finally:
+            chunks.close()
+
     @app.route('/order')
     @login_required
     def order():
-        orders = (
+        # Left unexecuted: order.html runs it after base.html's header has been
+        # streamed, so the page starts painting before the history query finishes.
+        # Tradeoff: by then the 200 status is already sent, so a DB or template
+        # error can't become a 500 page — guard_stream() logs it and ends the
+        # page with an error notice instead of silently truncating it.
+        orders_query = (
             Order.query
             .filter_by(user_id=current_user.id)
             .order_by(Order.order_date.desc())
-            .all()
         )
-        return render_template('order.html', orders=orders)
+        # Newest status event already reflected in the page; status updates
+        # start from here so changes made while the page renders aren't lost
+        last_status_event_id = (
+            db.session.query(func.max(OrderStatusEvent.id))
+            .filter(OrderStatusEvent.user_id == current_user.id)
+            .scalar()
+        ) or 0
+        return guard_stream(stream_template(
+            'order.html',
+            orders_query=orders_query,
+            last_status_event_id=last_status_event_id,
+            status_transport=app.config['STATUS_TRANSPORT'],
+            status_poll_interval=app.config['STATUS_POLL_INTERVAL_MS']
+        ), request.path)
+
+    def status_events_since(user_id, after):
+        # Deltas from the shared status log; uses the (user_id, id) index
+        return [
+            status_event_payload(event)
+            for event in (
+                OrderStatusEvent.query
+                .filter(OrderStatusEvent.user_id == user_id, OrderStatusEvent.id > after)
+                .order_by(OrderStatusEvent.id)
+                .limit(app.config['STATUS_POLL_LIMIT'])
+                .all()
+            )
+        ]
+
+    @app.route('/order/status/poll')
+    @login_required
+    def order_status_poll():
+        # Default transport for sync workers: returns straight away with any
+        # (order_id, status) deltas after ?after=<event id>, never blocks a worker
+        after = request.args.get('after', 0, type=int)
+        events = status_events_since(current_user.id, after)
+        return jsonify({
+            'events': events,
+            'last_event_id': events[-1]['id'] if events else after
+        })
+
+    @app.route('/order/status/stream')
+    @login_required
+    def order_status_stream():
+        # Server-Sent Events: only for async/gevent workers (STATUS_TRANSPORT = 'sse'),
+        # each open stream holds a worker for up to STATUS_STREAM_MAX_AGE
+        user_id = current_user.id
+        listener = status_broker.subscribe(user_id)
+
+        # Replay anything missed since the browser's last event. Reconnects send
+        # Last-Event-ID; the first connect uses the id rendered into /order.
+        last_event_id = request.headers.get('Last-Event-ID', type=int)
+        if last_event_id is None:
+            last_event_id = request.args.get('last_event_id', type=int)
+        missed = status_events_since(user_id, last_event_id) if last_event_id is not None else []
+
+        def stream():
+            deadline = time.monotonic() + app.config['STATUS_STREAM_MAX_AGE']
+            # Live publishes aren't ordered by id, so dedupe only against the replay
+            replayed = {payload['id'] for payload in missed}
+            try:
+                yield f"retry: {app.config['STATUS_STREAM_RETRY_MS']}\n\n"
+                for payload in missed:
+                    yield format_sse(payload)
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    try:
+                        payload = listener.get(timeout=min(app.config['STATUS_STREAM_KEEPALIVE'], remaining))
+                    except queue.Empty:
+                        yield ': keep-alive\n\n'
+                        continue
+                    if payload['id'] in replayed:
+                        continue  # already sent during replay
+                    yield format_sse(payload)
+            finally:
+                status_broker.unsubscribe(user_id, listener)
+
+        return Response(
+            stream(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
+    @app.route('/order/<int:order_id>/status', methods=['POST'])
+    def set_order_status(order_id):
+        # Back-office hook: runs inside a web worker, so SSE listeners in this
+        # worker get the delta at once; every transport reads it from the log
+        token = app.config['STATUS_UPDATE_TOKEN']
+        if not token or not hmac.compare_digest(request.headers.get('X-Status-Token', ''), token):
+            return jsonify({'success': False, 'message': 'Not allowed.'}), 403
+
+        data = request.get_json(silent=True) or {}
+        status = (data.get('status') or '').strip()
+        if not status:
+            return jsonify({'success': False, 'message': 'Status is required.'}), 400
+
+        order = Order.query.get(order_id)
+        if not order:
+            return jsonify({'success': False, 'message': 'Order not found.'}), 404
+
+        event = update_order_status(order, status)
+        return jsonify({'success': True, 'event_id': event.id})
 
     @app.route('/feedback', methods=['GET', 'POST'])
     @login_required